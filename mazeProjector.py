@@ -3,8 +3,9 @@
 Maze Drawer
 -----------
 This script reads a maze from an ASCII text file (formatted like the sample provided),
-parses it into a grid of MazeCells (each with boolean walls: north, east, south, west,
-and optionally a start (S) or goal (G) marker), and then draws the maze using Pillow.
+parses it into a Maze (a NumPy grid with one byte of bit flags per cell: walls north, east,
+south, west, plus the start (S) and goal (G) markers), and then paints the maze into a NumPy
+pixel buffer that is converted to a Pillow image.
 User input is requested for:
   - The filename of the maze file.
   - The cell side length in pixels.
@@ -19,32 +20,133 @@ For example, for a maze with R rows and C columns, the file has 2*R+1 lines.
 - These two types of lines alternate, and the last line gives the southern walls.
 """
 
-from PIL import Image, ImageDraw
+from PIL import Image
+import numpy as np
 import sys
 
-# Define a MazeCell class to store wall information and cell marker (start/goal)
-class MazeCell:
-    def __init__(self):
-        self.north = False  # wall on the north side
-        self.east  = False  # wall on the east side
-        self.south = False  # wall on the south side
-        self.west  = False  # wall on the west side
-        self.start = False  # True if this cell is marked as the start ('S')
-        self.goal  = False  # True if this cell is marked as the goal ('G')
+# Byte values of the characters that appear in the maze file.
+NEWLINE = ord('\n')
+SPACE   = ord(' ')
+DASH    = ord('-')
+PIPE    = ord('|')
+START   = ord('S')
+GOAL    = ord('G')
+# Lookup table of the bytes that str.strip() treats as whitespace, apart from the line breaks:
+# IS_WHITESPACE[byte_array] classifies every byte with a single table lookup.
+IS_WHITESPACE = np.zeros(256, dtype=bool)
+IS_WHITESPACE[list(b' \t\v\f\x1c\x1d\x1e\x1f')] = True
+
+# Colors used when drawing. The background and walls are gray levels written to all three RGB
+# channels at once, since NumPy fills a scalar much faster than an RGB tuple.
+BACKGROUND_VALUE = 255              # white
+WALL_VALUE       = 0                # black
+LIGHT_GREEN      = (144, 238, 144)  # start cell
+LIGHT_CORAL      = (240, 128, 128)  # goal cell
+
+# Bit flags packed into each cell of Maze.cells.
+NORTH_BIT = 1   # wall on the north side
+EAST_BIT  = 2   # wall on the east side
+SOUTH_BIT = 4   # wall on the south side
+WEST_BIT  = 8   # wall on the west side
+START_BIT = 16  # cell is marked as the start ('S')
+GOAL_BIT  = 32  # cell is marked as the goal ('G')
+
+# Define a Maze class to store wall information and cell markers (start/goal).
+# Every cell is a single uint8 of bit flags in a (rows, cols) array; the properties
+# below unpack one flag into a boolean matrix of the same shape.
+class Maze:
+    def __init__(self, cells):
+        self.cells = cells
+
+    def _flag(self, bit):
+        return (self.cells & bit) != 0
+
+    @property
+    def north(self):
+        return self._flag(NORTH_BIT)
+
+    @property
+    def east(self):
+        return self._flag(EAST_BIT)
+
+    @property
+    def south(self):
+        return self._flag(SOUTH_BIT)
+
+    @property
+    def west(self):
+        return self._flag(WEST_BIT)
+
+    @property
+    def start(self):
+        return self._flag(START_BIT)
+
+    @property
+    def goal(self):
+        return self._flag(GOAL_BIT)
+
+    @property
+    def horizontal_walls(self):
+        """
+        Walls on each horizontal grid line, shape (rows+1, cols). Row r is the line above cell
+        row r, so a wall shared by two vertically adjacent cells appears only once.
+        """
+        rows, cols = self.cells.shape
+        walls = np.zeros((rows + 1, cols), dtype=bool)
+        walls[:-1] |= self.north
+        walls[1:] |= self.south
+        return walls
+
+    @property
+    def vertical_walls(self):
+        """
+        Walls on each vertical grid line, shape (rows, cols+1). Column c is the line left of
+        cell column c, so a wall shared by two horizontally adjacent cells appears only once.
+        """
+        rows, cols = self.cells.shape
+        walls = np.zeros((rows, cols + 1), dtype=bool)
+        walls[:, :-1] |= self.west
+        walls[:, 1:] |= self.east
+        return walls
 
 def parse_maze_file(filename):
     """
-    Parses the maze text file and returns a 2D list of MazeCells along with the maze dimensions.
+    Parses the maze text file and returns a Maze along with the maze dimensions.
     The file is assumed to have 2*maze_rows+1 lines.
     """
     try:
-        with open(filename, 'r') as file:
-            # Remove newline characters from each line
-            lines = [line.rstrip('\n') for line in file if line.strip() != '']
+        with open(filename, 'rb') as file:
+            # Normalize "\r\n" and lone "\r" line endings to "\n", as text mode would.
+            data = file.read().replace(b'\r\n', b'\n').replace(b'\r', b'\n')
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         sys.exit(1)
 
+    # Locate the line boundaries in the raw bytes.
+    buf = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buf == NEWLINE)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(buf)]))
+    lengths = ends - starts
+
+    # Lay the lines out in a space-padded 2D byte array, one file line per row.
+    width = int(lengths.max())
+    lines = np.full((len(lengths), width), SPACE, dtype=np.uint8)
+    lines[np.arange(width) < lengths[:, np.newaxis]] = buf[buf != NEWLINE]
+
+    # Skip blank lines (empty or only whitespace): trailing ones after the last wall line, and any
+    # found where a horizontal line is expected, since those always contain "o" characters.
+    # A blank line in a cell-row position is kept: it is a valid row of cells without any
+    # vertical walls.
+    blank = IS_WHITESPACE[lines].all(axis=1)
+    last = np.flatnonzero(~blank)
+    keep = []
+    for i in range(last[-1] + 1 if len(last) else 0):
+        if not (blank[i] and len(keep) % 2 == 0):
+            keep.append(i)
+    lines = lines[keep]
+    lengths = lengths[keep]
+
     total_lines = len(lines)
     if total_lines % 2 == 0:
         raise ValueError("Maze file format error: Expected an odd number of lines.")
@@ -52,118 +154,93 @@ def parse_maze_file(filename):
     maze_rows = (total_lines - 1) // 2
     # The first horizontal line (which starts with 'o') determines the number of columns.
     # Its length should be: maze_cols * 4 + 1 (each cell has 3 chars for the wall segment plus an "o")
-    maze_cols = (len(lines[0]) - 1) // 4
-
-    # Create the maze grid (2D list of MazeCells)
-    maze = [[MazeCell() for _ in range(maze_cols)] for _ in range(maze_rows)]
-
-    # For each maze row, parse the horizontal (north/south) and vertical (west/east) wall lines.
-    for r in range(maze_rows):
-        # Parse the horizontal line above the row (north walls for row r)
-        horizontal_top = lines[2 * r]
-        for c in range(maze_cols):
-            # Each cell segment starts at index c*4+1 and spans 3 characters.
-            segment = horizontal_top[c * 4 + 1 : c * 4 + 4]
-            maze[r][c].north = (segment == '---')
-
-        # Parse the vertical line that contains cell interiors and west/east walls for row r.
-        vertical_line = lines[2 * r + 1]
-        for c in range(maze_cols):
-            # The west wall character for cell (r, c) is at index c*4.
-            west_char = vertical_line[c * 4]
-            # The cell interior is 3 characters long.
-            cell_interior = vertical_line[c * 4 + 1 : c * 4 + 4]
-            # The east wall character for cell (r, c) is right after the interior.
-            east_char = vertical_line[c * 4 + 4]
-            maze[r][c].west = (west_char == '|')
-            maze[r][c].east = (east_char == '|')
-
-            # Check the interior for markers ('S' for start, 'G' for goal)
-            cell_marker = cell_interior.strip()
-            if cell_marker == 'S':
-                maze[r][c].start = True
-            elif cell_marker == 'G':
-                maze[r][c].goal = True
-
-        # Parse the horizontal line below the row (south walls for row r)
-        horizontal_bottom = lines[2 * r + 2]
-        for c in range(maze_cols):
-            segment = horizontal_bottom[c * 4 + 1 : c * 4 + 4]
-            maze[r][c].south = (segment == '---')
+    maze_cols = (int(lengths[0]) - 1) // 4
+
+    # Even lines are horizontal wall lines, odd lines hold the cell interiors and vertical walls.
+    # Each cell occupies a 4-byte block: the "o"/"|" column followed by a 3-character segment.
+    horizontal = lines[0::2, : maze_cols * 4].reshape(maze_rows + 1, maze_cols, 4)
+    vertical = lines[1::2, : maze_cols * 4 + 1]
+
+    # A horizontal segment is a wall only if all three characters are "---".
+    horizontal_walls = (horizontal[:, :, 1:] == DASH).all(axis=2)
+
+    # The west wall character for cell (r, c) is at index c*4, the east wall right after the interior.
+    west = vertical[:, 0 : maze_cols * 4 : 4] == PIPE
+    east = vertical[:, 4 : maze_cols * 4 + 1 : 4] == PIPE
+
+    # Check the interiors for markers ('S' for start, 'G' for goal): the interior must hold
+    # exactly one non-whitespace character.
+    interior = vertical[:, : maze_cols * 4].reshape(maze_rows, maze_cols, 4)[:, :, 1:]
+    single = (~IS_WHITESPACE[interior]).sum(axis=2) == 1
+    start = single & (interior == START).any(axis=2)
+    goal = single & (interior == GOAL).any(axis=2)
+
+    # Pack the walls and markers into one byte of bit flags per cell.
+    cells = np.zeros((maze_rows, maze_cols), dtype=np.uint8)
+    cells |= horizontal_walls[:-1] * np.uint8(NORTH_BIT)  # the line above each row
+    cells |= east * np.uint8(EAST_BIT)
+    cells |= horizontal_walls[1:] * np.uint8(SOUTH_BIT)   # the line below each row
+    cells |= west * np.uint8(WEST_BIT)
+    cells |= start * np.uint8(START_BIT)
+    cells |= goal * np.uint8(GOAL_BIT)
 
+    maze = Maze(cells)
     return maze, maze_rows, maze_cols
 
+def wall_runs(walls):
+    """
+    Finds the runs of consecutive walls along each row of a boolean wall matrix.
+    Returns three arrays (rows, firsts, lasts): each run lies on row rows[i] and covers
+    columns firsts[i] up to (but not including) lasts[i].
+    """
+    # Pad each row with a False on both ends so every run has a rising and a falling edge.
+    padded = np.pad(walls.astype(np.int8), ((0, 0), (1, 1)))
+    edges = np.diff(padded, axis=1)
+    # np.nonzero walks the matrix in row-major order, so rising and falling edges pair up.
+    rows, firsts = np.nonzero(edges == 1)
+    _, lasts = np.nonzero(edges == -1)
+    return rows, firsts, lasts
+
 def draw_maze(maze, maze_rows, maze_cols, cell_size, wall_thickness):
     """
-    Draws the maze using Pillow.
-    - maze: 2D list of MazeCells.
+    Draws the maze by painting directly into a NumPy pixel buffer.
+    - maze: Maze holding the packed wall/marker flags.
     - maze_rows, maze_cols: dimensions of the maze.
     - cell_size: side length of each cell in pixels.
     - wall_thickness: thickness of walls in pixels.
     
     Returns a Pillow Image object.
     """
+    # Pixel coordinates of every grid line, computed once: xs[c] is the left edge of column c
+    # and ys[r] the top edge of row r, so no multiplications are needed while drawing.
+    xs = np.arange(maze_cols + 1) * cell_size
+    ys = np.arange(maze_rows + 1) * cell_size
+
     # Calculate image dimensions. Add wall_thickness to ensure outer walls are fully drawn.
-    img_width = maze_cols * cell_size + wall_thickness
-    img_height = maze_rows * cell_size + wall_thickness
-    image = Image.new("RGB", (img_width, img_height), "white")
-    draw = ImageDraw.Draw(image)
+    img_width = xs[-1] + wall_thickness
+    img_height = ys[-1] + wall_thickness
+    pixels = np.full((img_height, img_width, 3), BACKGROUND_VALUE, dtype=np.uint8)
 
     # First, fill the cells that are marked as start or goal.
     # (You can change the colors as desired.)
-    for r in range(maze_rows):
-        for c in range(maze_cols):
-            x = c * cell_size
-            y = r * cell_size
-            if maze[r][c].start:
-                # Fill start cell with light green.
-                draw.rectangle(
-                    [x + wall_thickness, y + wall_thickness, x + cell_size, y + cell_size],
-                    fill="lightgreen"
-                )
-            elif maze[r][c].goal:
-                # Fill goal cell with light coral.
-                draw.rectangle(
-                    [x + wall_thickness, y + wall_thickness, x + cell_size, y + cell_size],
-                    fill="lightcoral"
-                )
-
-    # Now, draw the walls for each cell.
-    for r in range(maze_rows):
-        for c in range(maze_cols):
-            x = c * cell_size
-            y = r * cell_size
-
-            # Draw the north wall
-            if maze[r][c].north:
-                draw.line(
-                    [(x, y), (x + cell_size, y)],
-                    fill="black",
-                    width=wall_thickness
-                )
-            # Draw the west wall
-            if maze[r][c].west:
-                draw.line(
-                    [(x, y), (x, y + cell_size)],
-                    fill="black",
-                    width=wall_thickness
-                )
-            # Draw the east wall
-            if maze[r][c].east:
-                draw.line(
-                    [(x + cell_size, y), (x + cell_size, y + cell_size)],
-                    fill="black",
-                    width=wall_thickness
-                )
-            # Draw the south wall
-            if maze[r][c].south:
-                draw.line(
-                    [(x, y + cell_size), (x + cell_size, y + cell_size)],
-                    fill="black",
-                    width=wall_thickness
-                )
-
-    return image
+    wt = wall_thickness
+    for marker, color in ((maze.start, LIGHT_GREEN), (maze.goal, LIGHT_CORAL)):
+        for r, c in np.argwhere(marker):
+            pixels[ys[r] + wt : ys[r + 1] + 1, xs[c] + wt : xs[c + 1] + 1] = color
+
+    # Now, draw the walls. Walls shared by neighbouring cells are merged first, and adjacent
+    # walls along the same grid line are fused into a single run, so each run is painted
+    # exactly once as one rectangular slice write.
+    # Draw the horizontal walls
+    for r, c0, c1 in zip(*wall_runs(maze.horizontal_walls)):
+        y = ys[r]
+        pixels[y : y + wt, xs[c0] : xs[c1] + wt] = WALL_VALUE
+    # Draw the vertical walls (runs go down each column, so scan the transposed matrix)
+    for c, r0, r1 in zip(*wall_runs(maze.vertical_walls.T)):
+        x = xs[c]
+        pixels[ys[r0] : ys[r1] + wt, x : x + wt] = WALL_VALUE
+
+    return Image.fromarray(pixels)
 
 def main():
     # Ask the user for the maze text file name.